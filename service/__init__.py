@@ -8,12 +8,14 @@ import sys
 from flask import Flask
 from service import config
 from service.common import log_handlers
+from service.common.json_provider import ORJSONProvider
 from flask_talisman import Talisman
 from flask_cors import CORS
 
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
+app.json = ORJSONProvider(app)
 talisman = Talisman(app)
 CORS(app)
 
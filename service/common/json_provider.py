@@ -0,0 +1,20 @@
+"""
+JSON Provider
+
+This module contains a Flask JSON provider that uses orjson for
+encoding responses and decoding request bodies
+"""
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """Serializes and deserializes JSON with orjson instead of the stdlib json"""
+
+    def dumps(self, obj, **kwargs):
+        """Serializes obj to a JSON formatted str"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserializes data from a JSON str or bytes"""
+        return orjson.loads(s)
@@ -18,6 +18,20 @@ if not DATABASE_URI:
 # Configure SQLAlchemy
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_pre_ping": True,
+    "pool_recycle": int(os.getenv("DATABASE_POOL_RECYCLE", "300")),
+}
+
+# SQLite may use a NullPool, which rejects pool sizing arguments
+if not DATABASE_URI.startswith("sqlite"):
+    SQLALCHEMY_ENGINE_OPTIONS["pool_size"] = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+    SQLALCHEMY_ENGINE_OPTIONS["max_overflow"] = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+
+# Seconds to cache account responses in each process; 0 turns the cache off.
+# Only enable it for a single instance: a write clears the cache on the
+# process that handled it, not on the other replicas behind the Service
+ACCOUNT_CACHE_TTL = int(os.getenv("ACCOUNT_CACHE_TTL", "0"))
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
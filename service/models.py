@@ -5,7 +5,9 @@ All of the models are stored in this module
 """
 import logging
 from datetime import date
+import orjson
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
 
 logger = logging.getLogger("flask.app")
 
@@ -40,6 +42,25 @@ class PersistentBase:
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def create_many(cls, records):
+        """
+        Creates several records in the database in a single transaction
+        """
+        if not records:
+            raise DataValidationError(f"Invalid {cls.__name__}: empty list")
+        logger.info("Creating %d records", len(records))
+        for record in records:
+            record.id = None  # id must be none to generate next primary key
+        db.session.add_all(records)
+        db.session.flush()
+        ids = [record.id for record in records]
+        db.session.commit()
+        # The commit expired every record, so fetch them back in one SELECT
+        # rather than letting each one lazily reload itself
+        found = {record.id: record for record in cls.query.filter(cls.id.in_(ids))}
+        return [found[record_id] for record_id in ids]
+
     def update(self):
         """
         Updates a Account to the database
@@ -69,12 +90,35 @@ class PersistentBase:
         logger.info("Processing all records")
         return cls.query.all()
 
+    @classmethod
+    def all_as_json(cls):
+        """Returns all of the records as a JSON array str"""
+        logger.info("Processing all records as JSON")
+        if db.engine.dialect.name != "postgresql":
+            records = cls.query.order_by(cls.id).all()
+            return orjson.dumps(records, default=json_default).decode()
+        # Let Postgres build the array; cast to text so psycopg2 does not decode it
+        fields = ", ".join(f"'{field}', t.{field}" for field in cls.SERIALIZED_FIELDS)
+        sql = text(
+            f"SELECT COALESCE(json_agg(json_build_object({fields}) ORDER BY t.id), "
+            f"'[]'::json)::text FROM {cls.__tablename__} t"
+        )
+        return db.session.execute(sql).scalar()
+
     @classmethod
     def find(cls, by_id):
         """Finds a record by it's ID"""
         logger.info("Processing lookup for id %s ...", by_id)
         return cls.query.get(by_id)
 
+    @classmethod
+    def find_or_404(cls, by_id):
+        """Finds a record by its ID or aborts with 404_NOT_FOUND"""
+        logger.info("Processing lookup or 404 for id %s ...", by_id)
+        return cls.query.get_or_404(
+            by_id, description=f"{cls.__name__} ID {by_id} not found"
+        )
+
 
 ######################################################################
 #  A C C O U N T   M O D E L
@@ -97,16 +141,18 @@ class Account(db.Model, PersistentBase):
     def __repr__(self):
         return f"<Account {self.name} id=[{self.id}]>"
 
+    # Fields exposed by serialize() and every JSON representation of an Account
+    SERIALIZED_FIELDS = ("id", "name", "email", "address", "phone_number", "date_joined")
+
+    def to_dict(self):
+        """Returns the serialized fields of a Account with their Python values"""
+        return {field: getattr(self, field) for field in self.SERIALIZED_FIELDS}
+
     def serialize(self):
         """Serializes a Account into a dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "address": self.address,
-            "phone_number": self.phone_number,
-            "date_joined": self.date_joined.isoformat()
-        }
+        data = self.to_dict()
+        data["date_joined"] = self.date_joined.isoformat()
+        return data
 
     def deserialize(self, data):
         """
@@ -143,3 +189,10 @@ class Account(db.Model, PersistentBase):
         """
         logger.info("Processing name query for %s ...", name)
         return cls.query.filter(cls.name == name)
+
+
+def json_default(obj):
+    """Lets orjson encode Accounts directly, leaving dates to its own encoder"""
+    if isinstance(obj, Account):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
@@ -3,145 +3,168 @@ Account Service
 
 This microservice handles the lifecycle of Accounts
 """
-# pylint: disable=unused-import
-from flask import jsonify, request, make_response, abort, url_for   # noqa; F401
-from service.models import Account
+import sys
+import threading
+import time
+import orjson
+from flask import request, abort, url_for, Response
+from service.models import Account, json_default
 from service.common import status  # HTTP Status Codes
 from . import app  # Import Flask application
 
+# Bound once so handlers skip the app.logger lookup on every request
+_LOGGER = app.logger
+
+_APPLICATION_JSON = sys.intern("application/json")
+
+# In-process cache of (timestamp, serialized body) keyed by "LIST" or ("GET", account_id)
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_CACHE_GENERATION = 0  # bumped by every write
+_TTL = app.config["ACCOUNT_CACHE_TTL"]  # seconds, off when 0
+_CACHE_MAX_ENTRIES = 1024
+
+# Constant response bodies built once at import time
+_INDEX_BODY = orjson.dumps({"name": "Account REST API Service", "version": "1.0"})
+_HEALTH_BODY = orjson.dumps({"status": "OK"})
+
 
 ############################################################
 # Health Endpoint
 ############################################################
-@app.route("/health")
+@app.route("/health", endpoint="health", strict_slashes=False)
 def health():
     """Health Status"""
-    return jsonify(dict(status="OK")), status.HTTP_200_OK
+    return Response(_HEALTH_BODY, status=status.HTTP_200_OK, mimetype="application/json")
 
 
 ######################################################################
 # GET INDEX
 ######################################################################
-@app.route("/")
+@app.route("/", endpoint="index")
 def index():
     """Root URL response"""
-    return (
-        jsonify(
-            name="Account REST API Service",
-            version="1.0",
-            # paths=url_for("list_accounts", _external=True),
-        ),
-        status.HTTP_200_OK,
-    )
+    return Response(_INDEX_BODY, status=status.HTTP_200_OK, mimetype="application/json")
 
 
 ######################################################################
 # CREATE A NEW ACCOUNT
 ######################################################################
-@app.route("/accounts", methods=["POST"])
+@app.route(
+    "/accounts",
+    methods=["POST"],
+    endpoint="create_accounts",
+    strict_slashes=False,
+)
 def create_accounts():
     """
     Creates an Account
     This endpoint will create an Account based the data in the body that is posted
+    A list of Accounts in the body creates all of them in a single transaction
     """
-    app.logger.info("Request to create an Account")
-    check_content_type("application/json")
+    _LOGGER.info("Request to create an Account")
+    check_content_type()
+    data = request.get_json()
+    if isinstance(data, list):
+        accounts = Account.create_many([Account().deserialize(item) for item in data])
+        _invalidate_cache()
+        body = orjson.dumps(accounts, default=json_default)
+        return Response(body, status=status.HTTP_201_CREATED, mimetype="application/json")
     account = Account()
-    account.deserialize(request.get_json())
+    account.deserialize(data)
     account.create()
+    _invalidate_cache()
     message = account.serialize()
-    # Uncomment once get_accounts has been implemented
-    # location_url = url_for("get_accounts", account_id=account.id, _external=True)
-    location_url = "/"  # Remove once get_accounts has been implemented
-    return make_response(
-        jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
-    )
+    location_url = url_for("read_account", account_id=account.id, _external=True)
+    return _json_resp(message, status.HTTP_201_CREATED, {"Location": location_url})
 
 
 ######################################################################
 # LIST ALL ACCOUNTS
 ######################################################################
-@app.route("/accounts", methods=["GET"])
+@app.route("/accounts", methods=["GET"], endpoint="list_accounts", strict_slashes=False)
 def list_accounts():
     """
     List all accounts
     This endpoint will search and returns accounts list in the body of response
     """
-    app.logger.info("Search for all accounts")
-    accounts = Account.all()
-    list_accounts = []
-    for account in accounts:
-        list_accounts.append(account.serialize())
-    return make_response(
-        jsonify(list_accounts), status.HTTP_200_OK
-    )
+    _LOGGER.info("Search for all accounts")
+    key = "LIST"
+    body = _cache_get(key)
+    if body is None:
+        generation = _CACHE_GENERATION
+        body = _cache_set(key, Account.all_as_json(), generation)
+    return Response(body, status=status.HTTP_200_OK, mimetype="application/json")
 
 
 ######################################################################
 # READ AN ACCOUNT
 ######################################################################
-@app.route("/accounts/<account_id>", methods=["GET"])
+@app.route(
+    "/accounts/<int:account_id>",
+    methods=["GET"],
+    endpoint="read_account",
+    strict_slashes=False,
+)
 def read_account(account_id):
     """
     Read an account with its ID from database
     This endpoint will search and returns account data in the body of response
     """
-    app.logger.info("Search for an account with given ID")
-    status_code = None
-    return_data = {}
-    try:
-        account = Account.find(account_id)
-        return_data = account.serialize()
-        status_code = status.HTTP_200_OK
-    except Exception:
-        status_code = status.HTTP_404_NOT_FOUND
-        return_data["error"] = "Account ID " + str(account_id) + " not found"
-    return make_response(jsonify(return_data), status_code)
+    _LOGGER.info("Search for an account with given ID")
+    key = ("GET", account_id)
+    body = _cache_get(key)
+    if body is not None:
+        return Response(body, status=status.HTTP_200_OK, mimetype="application/json")
+    generation = _CACHE_GENERATION
+    account = Account.find(account_id)
+    if account is None:
+        abort(status.HTTP_404_NOT_FOUND, f"Account ID {account_id} not found")
+    body = _cache_set(key, orjson.dumps(account.serialize()), generation)
+    return Response(body, status=status.HTTP_200_OK, mimetype="application/json")
 
 
 ######################################################################
 # UPDATE AN EXISTING ACCOUNT
 ######################################################################
-@app.route("/accounts/<account_id>", methods=["PUT"])
+@app.route(
+    "/accounts/<int:account_id>",
+    methods=["PUT"],
+    endpoint="update_account",
+    strict_slashes=False,
+)
 def update_account(account_id):
     """
     Update an account already saved in the database
     This endpoint will search and returns account data in the body of response
     """
-    app.logger.info("Search for an account with given ID")
-    status_code = None
-    return_data = {}
-    account = Account.find(account_id)
-    if type(account) == Account:
-        prepare_data = account.deserialize(request.get_json())
-        prepare_data.update()
-        status_code = status.HTTP_200_OK
-        return_data = account.serialize()
-    else:
-        status_code = status.HTTP_404_NOT_FOUND
-        # raise ValueError("Account ID " + str(account_id) + " not found")
-    return make_response(jsonify(return_data), status_code)
+    _LOGGER.info("Search for an account with given ID")
+    account = Account.find_or_404(account_id)
+    account.deserialize(request.get_json())
+    account.update()
+    _invalidate_cache(account_id)
+    return _json_resp(account.serialize())
 
 
 ######################################################################
 # DELETE AN ACCOUNT
 ######################################################################
-@app.route("/accounts/<account_id>", methods=["DELETE"])
+@app.route(
+    "/accounts/<int:account_id>",
+    methods=["DELETE"],
+    endpoint="delete_account",
+    strict_slashes=False,
+)
 def delete_account(account_id):
     """
     Delete an account with from the database
     This endpoint will search and removes account data
     """
-    app.logger.info("Search for an account with given ID")
-    status_code = None
-    return_data = {}
-    account = Account.find(account_id)
-    if type(account) == Account:
-        account.delete()
-        status_code = status.HTTP_204_NO_CONTENT
-    else:
-        raise ValueError("Account ID " + str(account_id) + " not found")
-    return make_response(jsonify(return_data), status_code)
+    _LOGGER.info("Search for an account with given ID")
+    account = Account.find_or_404(account_id)
+    account.delete()
+    _invalidate_cache(account_id)
+    return "", status.HTTP_204_NO_CONTENT
 
 
 ######################################################################
@@ -149,13 +172,67 @@ def delete_account(account_id):
 ######################################################################
 
 
-def check_content_type(media_type):
+def check_content_type(media_type=_APPLICATION_JSON):
     """Checks that the media type is correct"""
-    content_type = request.headers.get("Content-Type")
-    if content_type and content_type == media_type:
+    content_type = request.content_type
+    if content_type is media_type or content_type == media_type:
         return
-    app.logger.error("Invalid Content-Type: %s", content_type)
+    _LOGGER.error("Invalid Content-Type: %s", content_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {media_type}",
     )
+
+
+def _json_resp(obj, code=status.HTTP_200_OK, headers=None):
+    """Builds a JSON response from obj encoded once with orjson"""
+    return Response(
+        orjson.dumps(obj), status=code, headers=headers, mimetype="application/json"
+    )
+
+
+def _cache_get(key):
+    """Returns the cached response body for key, or None if missing or expired"""
+    if _TTL <= 0:
+        return None
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    stamp, body = entry
+    if time.monotonic() - stamp < _TTL:
+        return body
+    _CACHE.pop(key, None)
+    return None
+
+
+def _cache_set(key, body, generation):
+    """
+    Stores a serialized response body under key and returns it
+
+    generation is the value of _CACHE_GENERATION read before body was loaded.
+    If a write has happened since then, body may be stale and is not stored.
+    """
+    if _TTL <= 0:
+        return body
+    with _CACHE_LOCK:
+        if generation != _CACHE_GENERATION:
+            return body
+        now = time.monotonic()
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            for old_key, (stamp, _) in list(_CACHE.items()):
+                if now - stamp >= _TTL:
+                    _CACHE.pop(old_key, None)
+            if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+                _CACHE.clear()
+        _CACHE[key] = (now, body)
+    return body
+
+
+def _invalidate_cache(account_id=None):
+    """Drops the cached account list and, if given, the cached account"""
+    global _CACHE_GENERATION  # pylint: disable=global-statement
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _CACHE.pop("LIST", None)
+        if account_id is not None:
+            _CACHE.pop(("GET", account_id), None)
@@ -8,10 +8,14 @@ Test cases can be run with the following:
 import os
 import logging
 from unittest import TestCase
+from unittest.mock import patch
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import NotFound
 from tests.factories import AccountFactory
 from service.common import status  # HTTP Status Codes
 from service.models import db, Account, init_db
-from service.routes import app, delete_account
+from service import routes
+from service.routes import app, delete_account, _CACHE
 from service import talisman
 
 DATABASE_URI = os.getenv(
@@ -47,6 +51,7 @@ class TestAccountService(TestCase):
         """Runs before each test"""
         db.session.query(Account).delete()  # clean up the last tests
         db.session.commit()
+        _CACHE.clear()  # rows were removed behind the routes' back
 
         self.client = app.test_client()
 
@@ -74,6 +79,24 @@ class TestAccountService(TestCase):
             accounts.append(account)
         return accounts
 
+    def _bulk_create_accounts(self, count):
+        """Inserts accounts straight into the database in a single round trip"""
+        mappings = []
+        for account in AccountFactory.build_batch(count):
+            mappings.append(
+                {
+                    "name": account.name,
+                    "email": account.email,
+                    "address": account.address,
+                    "phone_number": account.phone_number,
+                    "date_joined": account.date_joined,
+                }
+            )
+        db.session.bulk_insert_mappings(Account, mappings)
+        db.session.commit()
+        _CACHE.clear()  # rows were added behind the routes' back
+        return Account.all()
+
     ######################################################################
     #  A C C O U N T   T E S T   C A S E S
     ######################################################################
@@ -82,6 +105,9 @@ class TestAccountService(TestCase):
         """It should get 200_OK from the Home Page"""
         response = self.client.get("/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.get_json()
+        self.assertEqual(data["name"], "Account REST API Service")
+        self.assertEqual(data["version"], "1.0")
 
     def test_health(self):
         """It should be healthy"""
@@ -103,6 +129,7 @@ class TestAccountService(TestCase):
         # Make sure location header is set
         location = response.headers.get("Location", None)
         self.assertIsNotNone(location)
+        self.assertTrue(location.endswith(f"{BASE_URL}/{response.get_json()['id']}"))
 
         # Check the data is correct
         new_account = response.get_json()
@@ -112,6 +139,41 @@ class TestAccountService(TestCase):
         self.assertEqual(new_account["phone_number"], account.phone_number)
         self.assertEqual(new_account["date_joined"], str(account.date_joined))
 
+    def test_create_accounts_in_bulk(self):
+        """It should Create several Accounts from a list in one request"""
+        accounts = AccountFactory.build_batch(3)
+        response = self.client.post(
+            BASE_URL,
+            json=[account.serialize() for account in accounts],
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        new_accounts = response.get_json()
+        self.assertEqual(len(new_accounts), 3)
+        for account, new_account in zip(accounts, new_accounts):
+            self.assertIsNotNone(new_account["id"])
+            self.assertEqual(new_account["name"], account.name)
+            self.assertEqual(new_account["email"], account.email)
+            self.assertEqual(new_account["date_joined"], str(account.date_joined))
+
+        response = self.client.get(BASE_URL)
+        self.assertEqual(len(response.get_json()), 3)
+
+    def test_bad_request_empty_bulk(self):
+        """It should not Create Accounts from an empty list"""
+        response = self.client.post(BASE_URL, json=[], content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bad_request_in_bulk(self):
+        """It should not Create any Account when one in the list is invalid"""
+        response = self.client.post(
+            BASE_URL,
+            json=[AccountFactory().serialize(), {"name": "not enough data"}],
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Account.all(), [])
+
     def test_bad_request(self):
         """It should not Create an Account when sending the wrong data"""
         response = self.client.post(BASE_URL, json={"name": "not enough data"})
@@ -190,6 +252,31 @@ class TestAccountService(TestCase):
         # accountDB = response.get_json()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_not_found_body(self):
+        """It should return the same 404 body from GET, PUT and DELETE"""
+        account = AccountFactory()
+        for method in (self.client.get, self.client.put, self.client.delete):
+            response = method(f"{BASE_URL}/0", json=account.serialize())
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            data = response.get_json()
+            self.assertEqual(data["status"], status.HTTP_404_NOT_FOUND)
+            self.assertEqual(data["error"], "Not Found")
+            self.assertIn("Account ID 0 not found", data["message"])
+
+    def test_account_id_not_an_integer(self):
+        """It should return 404 without a lookup when the account id is not an integer"""
+        for method in (self.client.get, self.client.put, self.client.delete):
+            response = method(f"{BASE_URL}/abc")
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("service.routes.Account.find")
+    def test_read_account_database_error(self, find_mock):
+        """It should return 500 and not 404 when the database fails"""
+        find_mock.side_effect = SQLAlchemyError("database is down")
+        with patch.dict(app.config, {"PROPAGATE_EXCEPTIONS": False}):
+            response = self.client.get(f"{BASE_URL}/1")
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     def test_delete_account(self):
         """ It should delete an account data from database """
         # We firstly create an account in the database
@@ -207,8 +294,13 @@ class TestAccountService(TestCase):
             json=account.serialize(),
             content_type="application/json"
         )
-        self.assertRaises(ValueError, delete_account, savedAccount["id"])
+        self.assertRaises(NotFound, delete_account, savedAccount["id"])
         self.assertEqual(response2.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response2.data, b"")
+
+        # Deleting it again should report it as not found
+        response3 = self.client.delete(BASE_URL + "/" + str(savedAccount["id"]))
+        self.assertEqual(response3.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_list_all_accounts(self):
         """ It should get HTTP_200_OK from all accounts as a list or dict """
@@ -217,13 +309,94 @@ class TestAccountService(TestCase):
         # Testing for no accounts in database
         self.assertEqual(accounts, [])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self._create_accounts(5)
+        self._bulk_create_accounts(5)
         response2 = self.client.get("/accounts")
         accounts = response2.get_json()
 
         # Testing for 5 accounts added in database and returned in list or dict
         self.assertEqual(len(accounts), 5)
 
+    @patch.object(routes, "_TTL", 60)
+    def test_list_accounts_cache_invalidated(self):
+        """It should not serve a stale cached list after a write"""
+        response = self.client.get(BASE_URL)
+        self.assertEqual(response.get_json(), [])
+        self._create_accounts(1)
+        response = self.client.get(BASE_URL)
+        accounts = response.get_json()
+        self.assertEqual(len(accounts), 1)
+        self.assertEqual(response.content_type, "application/json")
+
+        # Updating must drop both the cached list and the cached account
+        account_id = accounts[0]["id"]
+        self.client.get(f"{BASE_URL}/{account_id}")
+        accounts[0]["name"] = "Cache Buster"
+        self.client.put(f"{BASE_URL}/{account_id}", json=accounts[0])
+        response = self.client.get(f"{BASE_URL}/{account_id}")
+        self.assertEqual(response.get_json()["name"], "Cache Buster")
+        response = self.client.get(BASE_URL)
+        self.assertEqual(response.get_json()[0]["name"], "Cache Buster")
+
+        # Deleting must drop it from the list
+        self.client.delete(f"{BASE_URL}/{account_id}")
+        response = self.client.get(BASE_URL)
+        self.assertEqual(response.get_json(), [])
+
+    def test_trailing_slash(self):
+        """It should serve the accounts URLs with a trailing slash without redirecting"""
+        response = self.client.get(BASE_URL + "/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.get_json(), [])
+
+    @patch.object(routes, "_TTL", 60)
+    def test_cache_entry_expires(self):
+        """It should replace a cached account once its entry has expired"""
+        account = self._create_accounts(1)[0]
+        key = ("GET", account.id)
+        self.client.get(f"{BASE_URL}/{account.id}")
+        first_stamp, _ = _CACHE[key]
+        self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(_CACHE[key][0], first_stamp)
+
+        with patch("service.routes.time.monotonic", return_value=first_stamp + 61):
+            response = self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.get_json()["id"], account.id)
+        self.assertEqual(_CACHE[key][0], first_stamp + 61)
+
+    @patch.object(routes, "_TTL", 60)
+    @patch.object(routes, "_CACHE_MAX_ENTRIES", 2)
+    def test_cache_size_is_bounded(self):
+        """It should not keep more cache entries than its limit"""
+        accounts = self._create_accounts(3)
+        for account in accounts:
+            self.client.get(f"{BASE_URL}/{account.id}")
+            self.assertLessEqual(len(_CACHE), 2)
+        self.assertIn(("GET", accounts[-1].id), _CACHE)
+
+    @patch.object(routes, "_TTL", 0)
+    def test_cache_disabled(self):
+        """It should not cache responses when the TTL is 0"""
+        self._create_accounts(1)
+        self.client.get(BASE_URL)
+        self.assertEqual(_CACHE, {})
+
+    @patch.object(routes, "_TTL", 60)
+    def test_cache_skips_body_loaded_before_a_write(self):
+        """It should not cache a list that was loaded before a write finished"""
+        load_list = Account.all_as_json
+
+        def load_then_write():
+            body = load_list()
+            self.client.post(BASE_URL, json=AccountFactory().serialize())
+            return body
+
+        with patch("service.routes.Account.all_as_json", side_effect=load_then_write):
+            response = self.client.get(BASE_URL)
+        self.assertEqual(response.get_json(), [])
+        self.assertNotIn("LIST", _CACHE)
+        response = self.client.get(BASE_URL)
+        self.assertEqual(len(response.get_json()), 1)
+
     def test_method_not_allowed(self):
         """It should not allow an illegal method call"""
         response = self.client.delete(BASE_URL)